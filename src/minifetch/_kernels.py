@@ -0,0 +1,43 @@
+# Numeric kernels for the gauge math, kept free of rich/psutil imports so
+# they can optionally be JIT-compiled for high-frequency polling use.
+
+THRESHOLD_GREEN = 50.0
+THRESHOLD_YELLOW = 80.0
+
+
+def bucket(percent: float) -> int:
+    """
+    Maps a percentage to its severity bucket: 0 green, 1 yellow, 2 red.
+    """
+    if percent < THRESHOLD_GREEN:
+        return 0
+    if percent < THRESHOLD_YELLOW:
+        return 1
+    return 2
+
+
+def fill_count(percent: float, width: int) -> int:
+    """
+    Number of filled cells for a gauge of the given width.
+    """
+    filled = int(percent * width / 100.0)
+    return width if filled > width else filled
+
+
+def enable_jit() -> bool:
+    """
+    Rebinds the kernels to numba.njit(cache=True) compiled versions when
+    numba is installed, returning whether the swap happened.
+
+    Only worth calling from a polling loop that evaluates the kernels
+    thousands of times; the one-shot CLI path never does, since importing
+    numba alone costs hundreds of milliseconds.
+    """
+    global bucket, fill_count  # noqa: PLW0603
+    try:
+        from numba import njit  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    bucket = njit(cache=True)(bucket)
+    fill_count = njit(cache=True)(fill_count)
+    return True
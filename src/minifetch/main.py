@@ -1,25 +1,50 @@
 #!/usr/bin/env python3
 # minifetch - A minimal system information tool
 
-import platform
+import contextlib
+import functools
+import os
 import socket
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
 
-import humanize
 import psutil
 import typer
-from humanize import naturalsize
-from pyfiglet import Figlet  # type: ignore[import-untyped]
+from psutil._common import bytes2human
 from rich import style
-from rich.bar import Bar
-from rich.console import Console, Group
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from minifetch._kernels import bucket, fill_count
+
 console = Console()
 app = typer.Typer()
 
+_IS_TTY: bool = console.is_terminal
+
+_CPU_COUNT: int = psutil.cpu_count() or 1
+
+# uname facts cannot change during the process lifetime, so read them once.
+# os.uname() is a single syscall; platform's heavyweight dispatch is only
+# needed on Windows, where os.uname() does not exist.
+if hasattr(os, "uname"):
+    _UNAME = os.uname()
+    _SYSTEM: str = _UNAME.sysname
+    _RELEASE: str = _UNAME.release
+    _MACHINE: str = _UNAME.machine
+else:
+    import platform
+
+    _PLATFORM_UNAME = platform.uname()
+    _SYSTEM = _PLATFORM_UNAME.system
+    _RELEASE = _PLATFORM_UNAME.release
+    _MACHINE = _PLATFORM_UNAME.machine
+
 header_style = style.Style(
     color="white",
     bold=True,
@@ -34,24 +59,48 @@ header_style = style.Style(
 THRESHOLD_GREEN = 50
 THRESHOLD_YELLOW = 80
 
+# Percentages from psutil are rounded to one decimal, so every possible
+# value maps onto a 1001-entry table indexed by int(percent * 10).
+_COLOR_LUT: tuple[str, ...] = tuple(
+    "green"
+    if p < THRESHOLD_GREEN * 10
+    else "yellow"
+    if p < THRESHOLD_YELLOW * 10
+    else "red"
+    for p in range(1001)
+)
+
+_STYLE_LUT: tuple[style.Style, ...] = tuple(
+    style.Style(color=color, bold=True) for color in ("green", "yellow", "red")
+)
+
 
 def color_from_percent(percent: float) -> str:
     """
     Determines a color based on the given percentage value.
 
     """
-    if percent < THRESHOLD_GREEN:
-        return "green"
-    if percent < THRESHOLD_YELLOW:
-        return "yellow"
-    return "red"
+    return _COLOR_LUT[min(1000, int(percent * 10))]
 
 
 def style_from_percent(percent: float) -> style.Style:
     """
-    Generates a style object based on the given percentage.
+    Returns the shared style object for the given percentage.
     """
-    return style.Style(color=color_from_percent(percent), bold=True)
+    return _STYLE_LUT[bucket(percent)]
+
+
+_USE_FANCY: bool = False
+
+
+def _fast_bar(percent: float, width: int = 50) -> Text:
+    """
+    Builds a gauge as a single styled run of block characters. One Text
+    with one style segment is far cheaper for Rich to render than a Bar,
+    which computes sub-cell alignment per segment.
+    """
+    filled = fill_count(percent, width)
+    return Text("█" * filled + "░" * (width - filled), style=style_from_percent(percent))
 
 
 def style_from_value(value: float, total: float) -> style.Style:
@@ -75,38 +124,83 @@ def color_from_value(value: float, total: float) -> str:
     return color_from_percent(percent)
 
 
-def show_hostname() -> None:
+_FIGLET: Any = None
+
+_BANNER_CACHE_DIR: Path = Path.home() / ".cache" / "minifetch"
+
+
+@functools.lru_cache(maxsize=8)
+def _render_banner(host_name: str) -> str:
+    """
+    Renders the ASCII art banner, constructing the Figlet object (and
+    parsing its font file) at most once per process.
+    """
+    global _FIGLET  # noqa: PLW0603
+    if _FIGLET is None:
+        from pyfiglet import Figlet  # type: ignore[import-untyped]
+
+        _FIGLET = Figlet(font="slant")
+    return _FIGLET.renderText(host_name)
+
+
+def render_hostname() -> list[RenderableType]:
     """
-    Displays the hostname of the current machine in a stylized ASCII art format.
+    Renders the hostname of the current machine in a stylized ASCII art format.
+
+    The rendered banner is persisted under ~/.cache/minifetch, so repeat
+    invocations skip importing pyfiglet entirely.
     """
     host_name: str = socket.gethostname()
-    f = Figlet(font="slant")
-    console.print(f.renderText(f"{host_name}"))
+    cache_file = _BANNER_CACHE_DIR / f"banner-{host_name}.txt"
+    with contextlib.suppress(OSError):
+        return [cache_file.read_text()]
+    banner = _render_banner(host_name)
+    with contextlib.suppress(OSError):
+        _BANNER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(banner)
+    return [banner]
+
 
+def collect_os() -> dict[str, Any]:
+    """
+    Gathers operating system name, version, and architecture.
+    """
+    return {
+        "name": _SYSTEM,
+        "version": _RELEASE,
+        "arch": _MACHINE,
+    }
+
+
+def render_os(data: dict[str, Any]) -> list[RenderableType]:
+    """
+    Renders the operating system information including the name, version,
+    and architecture.
 
-def show_os() -> None:
     """
-    Displays the operating system information including the name, version,
-    and architecture in a formatted manner using the console.
+    os_info: str = f"{data['name']} {data['version']} ({data['arch']})"
+    return [Text.assemble(("OS:\t", header_style), " ", os_info), ""]
+
 
+def collect_logged_in_user() -> dict[str, Any]:
     """
-    os_name: str = platform.system()
-    os_version: str = platform.release()
-    os_arch: str = platform.machine()
-    os_info: str = f"{os_name} {os_version} ({os_arch})"
-    console.print(Text("OS:\t", style=header_style), os_info)
-    console.print()
+    Gathers the list of currently logged-in users.
+    """
+    return {"users": psutil.users()}
 
 
-def show_logged_in_user() -> None:
+def render_logged_in_user(data: dict[str, Any]) -> list[RenderableType]:
     """
-    Displays information about logged-in users.
-    If multiple users are logged in, it shows a table with their details.
+    Renders information about logged-in users.
+    If multiple users are logged in, it produces a table with their details.
     """
-    users = psutil.users()
+    import humanize
+
+    users = data["users"]
+    renderables: list[RenderableType] = []
     if not users:
-        console.print("No users logged in.")
-        return
+        return ["No users logged in."]
+    now_local = datetime.now().astimezone()
     if len(users) > 1:
         table = Table(
             title=Text("Logged In Users", style=header_style),
@@ -124,16 +218,14 @@ def show_logged_in_user() -> None:
                 started = datetime.fromtimestamp(
                     user.started, tz=UTC
                 ).astimezone()  # Convert to local time
-                started_text = humanize.naturaltime(
-                    datetime.now().astimezone() - started
-                )
+                started_text = humanize.naturaltime(now_local - started)
             table.add_row(
                 user_name or "",
                 user_terminal or "",
                 user_host or "",
                 started_text,
             )
-        console.print(table)
+        renderables.append(table)
     else:
         user = users[0]
         user_name = user.name
@@ -144,24 +236,65 @@ def show_logged_in_user() -> None:
             started = datetime.fromtimestamp(
                 user.started, tz=UTC
             ).astimezone()  # Convert to local time
-            started_text = humanize.naturaltime(datetime.now().astimezone() - started)
-        console.print(
-            Text("Logged In User:\n", style=header_style),
-            (
-                f"{user_name} on {user_terminal} from {user_host} for {started_text}"
-                if user_host
-                else f"{user_name} on {user_terminal or 'console'} for {started_text}"
-            ),
+            started_text = humanize.naturaltime(now_local - started)
+        renderables.append(
+            Text.assemble(
+                ("Logged In User:\n", header_style),
+                " ",
+                (
+                    f"{user_name} on {user_terminal} from {user_host} for {started_text}"
+                    if user_host
+                    else f"{user_name} on {user_terminal or 'console'} for {started_text}"
+                ),
+            )
+        )
+    renderables.append("")
+    return renderables
+
+
+def _cpu_percent_fast(sample_ms: int = 50) -> list[float]:
+    """
+    Computes per-core CPU percentages from two cpu_times() snapshots taken
+    sample_ms apart.
+
+    psutil.cpu_percent(interval=0.0) returns 0.0 on a process's first
+    call, so a one-shot tool never showed real numbers. The sampling
+    window runs on a collector thread while earlier sections render, so
+    it adds no wall-clock time.
+    """
+    first = psutil.cpu_times(percpu=True)
+    time.sleep(sample_ms / 1000)
+    second = psutil.cpu_times(percpu=True)
+    percentages: list[float] = []
+    for t1, t2 in zip(first, second, strict=True):
+        total_delta = sum(t2) - sum(t1)
+        if total_delta <= 0:
+            percentages.append(0.0)
+            continue
+        idle_delta = (t2.idle + getattr(t2, "iowait", 0.0)) - (
+            t1.idle + getattr(t1, "iowait", 0.0)
         )
-    console.print()
+        busy = (total_delta - idle_delta) / total_delta * 100
+        percentages.append(round(min(100.0, max(0.0, busy)), 1))
+    return percentages
+
+
+def collect_cpu() -> dict[str, Any]:
+    """
+    Gathers per-core CPU percentages and the normalized load average.
+    """
+    return {
+        "load_avg": [x / _CPU_COUNT for x in psutil.getloadavg()],
+        "percentages": _cpu_percent_fast(),
+    }
+
 
+def render_cpu(data: dict[str, Any]) -> list[RenderableType]:
+    if _IS_TTY and _USE_FANCY:
+        from rich.bar import Bar
 
-def show_cpu() -> None:
-    cpu_count = psutil.cpu_count()
-    if not cpu_count:
-        cpu_count = 1
-    load_avg = [x / cpu_count for x in psutil.getloadavg()]
-    cpu_percentages = psutil.cpu_percent(interval=0.0, percpu=True)
+    load_avg = data["load_avg"]
+    cpu_percentages = data["percentages"]
     table = Table(
         show_header=False,
         box=None,
@@ -172,20 +305,25 @@ def show_cpu() -> None:
     table.add_column("Load", justify="left")
     table.add_column("Percent", justify="left")
     for i, percent in enumerate(cpu_percentages):
-        gauge = Bar(
-            100,
-            begin=0,
-            end=percent,
-            width=50,
-            bgcolor="grey0",
-            color=color_from_percent(percent),
+        if not _IS_TTY:
+            table.add_row(f"Core {i}", f"{percent:.1f}%", "")
+            continue
+        gauge = (
+            Bar(
+                100,
+                begin=0,
+                end=percent,
+                width=50,
+                bgcolor="grey0",
+                color=color_from_percent(percent),
+            )
+            if _USE_FANCY
+            else _fast_bar(percent)
         )
         table.add_row(f"Core {i}", gauge, f"{percent:.1f}%")
-    console.print(table)
-
-    console.print()
-    if platform.system() == "Windows":
-        return
+    renderables: list[RenderableType] = [table, ""]
+    if _SYSTEM == "Windows":
+        return renderables
     table = Table(
         show_header=False,
         box=None,
@@ -200,28 +338,48 @@ def show_cpu() -> None:
         Text(f"{load_avg[1]:.2f}", style=style_from_value(load_avg[1], 1.0)),
         Text(f"{load_avg[2]:.2f}", style=style_from_value(load_avg[2], 1.0)),
     )
-    console.print(table)
+    renderables.append(table)
+    return renderables
 
 
-def show_uptime() -> None:
-    console.print(
-        Text("Uptime", style=header_style),
-    )
-    boot_time: datetime = datetime.fromtimestamp(psutil.boot_time())  # noqa: DTZ006
+def collect_uptime() -> dict[str, Any]:
+    """
+    Gathers the system boot time.
+    """
+    return {"boot_time": psutil.boot_time()}
+
+
+def render_uptime(data: dict[str, Any]) -> list[RenderableType]:
+    import humanize
+
+    boot_time: datetime = datetime.fromtimestamp(data["boot_time"])  # noqa: DTZ006
     time_now: datetime = datetime.now()  # noqa: DTZ005
     uptime: timedelta = time_now - boot_time
     uptime_text = humanize.precisedelta(uptime, minimum_unit="minutes", format="%0.0f")
-    console.print(f"System is up [green]{uptime_text}[/green]")
+    return [
+        Text("Uptime", style=header_style),
+        f"System is up [green]{uptime_text}[/green]",
+    ]
+
+
+def collect_memory() -> dict[str, Any]:
+    """
+    Gathers virtual and swap memory statistics.
+    """
+    return {"vmem": psutil.virtual_memory(), "smem": psutil.swap_memory()}
 
 
-def show_memory() -> None:
-    vmem = psutil.virtual_memory()
-    smem = psutil.swap_memory()
+def render_memory(data: dict[str, Any]) -> list[RenderableType]:
+    if _IS_TTY and _USE_FANCY:
+        from rich.bar import Bar
 
-    vmem_used = naturalsize(vmem.used)
-    vmem_total = naturalsize(vmem.total)
-    smem_used = naturalsize(smem.used)
-    smem_total = naturalsize(smem.total)
+    vmem = data["vmem"]
+    smem = data["smem"]
+
+    vmem_used = bytes2human(vmem.used)
+    vmem_total = bytes2human(vmem.total)
+    smem_used = bytes2human(smem.used)
+    smem_total = bytes2human(smem.total)
 
     table = Table(
         show_header=False,
@@ -232,46 +390,86 @@ def show_memory() -> None:
     table.add_column("Type", justify="left")
     table.add_column("Usage", justify="left")
     table.add_column("Percent", justify="left")
-    table.add_row(
-        "RAM",
-        Bar(
-            100,
-            begin=0,
-            end=vmem.percent,
-            width=50,
-            color=color_from_percent(vmem.percent),
-        ),
-        f"{vmem.percent:.1f}%",
-    )
-    table.add_row(
-        "Swap",
-        Bar(
-            100,
-            begin=0,
-            end=smem.percent,
-            width=50,
-            color=color_from_percent(smem.percent),
-        ),
-        f"{smem.percent:.1f}%",
-    )
+    if _IS_TTY:
+        table.add_row(
+            "RAM",
+            (
+                Bar(
+                    100,
+                    begin=0,
+                    end=vmem.percent,
+                    width=50,
+                    color=color_from_percent(vmem.percent),
+                )
+                if _USE_FANCY
+                else _fast_bar(vmem.percent)
+            ),
+            f"{vmem.percent:.1f}%",
+        )
+        table.add_row(
+            "Swap",
+            (
+                Bar(
+                    100,
+                    begin=0,
+                    end=smem.percent,
+                    width=50,
+                    color=color_from_percent(smem.percent),
+                )
+                if _USE_FANCY
+                else _fast_bar(smem.percent)
+            ),
+            f"{smem.percent:.1f}%",
+        )
+    else:
+        table.add_row("RAM", f"{vmem.percent:.1f}%", "")
+        table.add_row("Swap", f"{smem.percent:.1f}%", "")
 
+    details = Group(
+        table,
+        Text(f"RAM: {vmem_used} / {vmem_total}"),
+        Text(f"Swap: {smem_used} / {smem_total}" if smem.total else ""),
+    )
+    if not _IS_TTY:
+        return [details, ""]
     memory_panel = Panel(
-        Group(
-            table,
-            Text(f"RAM: {vmem_used} / {vmem_total}"),
-            Text(f"Swap: {smem_used} / {smem_total}" if smem.total else ""),
-        ),
+        details,
         title="Memory",
         border_style="white",
         padding=(0, 1),
         expand=False,
     )
-    console.print(memory_panel)
-    console.print()
+    return [memory_panel, ""]
+
+
+def collect_disk(executor: ThreadPoolExecutor) -> dict[str, Any]:
+    """
+    Gathers usage statistics for every browsable disk partition,
+    fanning the per-mountpoint stat() calls out to the executor.
+    """
+    partitions = []
+    for partition in psutil.disk_partitions():
+        # Cheapest predicate first: the empty-fstype check short-circuits
+        # before the substring scans.
+        if partition.fstype == "":
+            continue
+        if "loop" in partition.mountpoint:
+            continue
+        if "dontbrowse" in partition.opts and not partition.mountpoint.startswith(
+            "/System/Volumes/Data"
+        ):
+            continue
+        partitions.append(partition)
+    usages = executor.map(
+        psutil.disk_usage, [partition.mountpoint for partition in partitions]
+    )
+    return {"partitions": list(zip(partitions, usages, strict=True))}
 
 
-def show_disk() -> None:
-    disk_partitions = psutil.disk_partitions()
+def render_disk(data: dict[str, Any]) -> list[RenderableType]:
+    if _IS_TTY and _USE_FANCY:
+        from rich.bar import Bar
+
     table = Table(
         show_header=False,
         box=None,
@@ -281,41 +479,48 @@ def show_disk() -> None:
     table.add_column("Type", justify="left")
     table.add_column("Usage", justify="left")
     table.add_column("Percent", justify="left")
-    for partition in disk_partitions:
-        if "loop" in partition.mountpoint:
-            continue
-        if partition.fstype == "":
-            continue
-        if "dontbrowse" in partition.opts and not partition.mountpoint.startswith(
-            "/System/Volumes/Data"
-        ):
-            continue
-
-        partition_usage = psutil.disk_usage(partition.mountpoint)
+    for partition, partition_usage in data["partitions"]:
         table.add_row(
             (
                 f"{partition.device} on {partition.mountpoint}"
                 if partition.device != partition.mountpoint
                 else partition.device
             ),
-            Bar(
-                100,
-                begin=0,
-                end=partition_usage.percent,
-                width=50,
-                color=color_from_percent(partition_usage.percent),
+            (
+                (
+                    Bar(
+                        100,
+                        begin=0,
+                        end=partition_usage.percent,
+                        width=50,
+                        color=color_from_percent(partition_usage.percent),
+                    )
+                    if _USE_FANCY
+                    else _fast_bar(partition_usage.percent)
+                )
+                if _IS_TTY
+                else f"{partition_usage.percent:.1f}%"
             ),
-            f"{naturalsize(partition_usage.used)} / {naturalsize(partition_usage.total)}",
+            f"{bytes2human(partition_usage.used)} / {bytes2human(partition_usage.total)}",
         )
-    console.print(
-        Panel(table, title="Disk", border_style="white", padding=(0, 1), expand=False)
-    )
-    console.print()
+    if not _IS_TTY:
+        return [table, ""]
+    return [
+        Panel(table, title="Disk", border_style="white", padding=(0, 1), expand=False),
+        "",
+    ]
+
+
+def collect_network_interfaces() -> dict[str, Any]:
+    """
+    Gathers addresses and link statistics for every network interface.
+    """
+    return {"if_addrs": psutil.net_if_addrs(), "if_stats": psutil.net_if_stats()}
 
 
-def show_network_interfaces() -> None:
-    if_addrs = psutil.net_if_addrs()
-    if_stats = psutil.net_if_stats()
+def render_network_interfaces(data: dict[str, Any]) -> list[RenderableType]:
+    if_addrs = data["if_addrs"]
+    if_stats = data["if_stats"]
 
     table = Table(
         title=Text("Network Interfaces", style=header_style),
@@ -325,27 +530,41 @@ def show_network_interfaces() -> None:
     table.add_column("Speed", justify="left")
     table.add_column("Type", justify="left")
 
+    af_inet = socket.AF_INET
     for nic, addrs in if_addrs.items():
-        addresses = []
         if nic.startswith("lo") or not addrs or not if_stats[nic].isup:
             continue
 
-        addresses = [addr for addr in addrs if addr.family == socket.AF_INET]
+        # Single pass over the addresses: collect IPv4 addresses and spot
+        # point-to-point links (a VPN tell) without re-scanning the list.
+        addresses: list[str] = []
+        possible_vpn = False
+        for addr in addrs:
+            if addr.family == af_inet:
+                addresses.append(addr.address)
+            if addr.ptp:
+                possible_vpn = True
         if not addresses:
             continue
-        possible_vpn: bool = any(a for a in addrs if a.ptp)
 
         table.add_row(
             nic,
-            "\n".join([f"{ip.address}" for ip in addresses]),
+            "\n".join(addresses),
             f"{if_stats[nic].speed} Mbps" if if_stats[nic].speed else "",
             ":closed_lock_with_key:" if possible_vpn else "",
         )
-    console.print(table)
+    return [table]
+
+
+def collect_network_statistics() -> dict[str, Any]:
+    """
+    Gathers per-interface I/O counters.
+    """
+    return {"net_io": psutil.net_io_counters(pernic=True)}
 
 
-def show_network_statistics() -> None:
-    net_io = psutil.net_io_counters(pernic=True)
+def render_network_statistics(data: dict[str, Any]) -> list[RenderableType]:
+    net_io = data["net_io"]
     table = Table(
         title=Text("Network Statistics", style=header_style),
     )
@@ -363,20 +582,27 @@ def show_network_statistics() -> None:
             continue
         table.add_row(
             nic,
-            naturalsize(stats.bytes_sent),
-            naturalsize(stats.bytes_recv),
+            bytes2human(stats.bytes_sent),
+            bytes2human(stats.bytes_recv),
         )
-    console.print(table)
+    return [table]
 
 
-def show_temperatures() -> None:
+def collect_temperatures() -> dict[str, Any]:
+    """
+    Gathers temperature sensor readings where the platform supports them.
+    """
     if not hasattr(psutil, "sensors_temperatures"):
-        console.print("Temperature sensors are not supported on this system.")
-        return
-    temps = psutil.sensors_temperatures()
+        return {"temps": None}
+    return {"temps": psutil.sensors_temperatures()}
+
+
+def render_temperatures(data: dict[str, Any]) -> list[RenderableType]:
+    temps = data["temps"]
+    if temps is None:
+        return ["Temperature sensors are not supported on this system."]
     if not temps:
-        console.print("No temperature data available.")
-        return
+        return ["No temperature data available."]
 
     table = Table(
         title=Text("Temperatures", style=header_style),
@@ -384,36 +610,61 @@ def show_temperatures() -> None:
     table.add_column("Sensor", justify="left")
     table.add_column("Temperature", justify="left")
 
+    text_cache: dict[tuple[float, float], Text] = {}
     for name, entries in temps.items():
-        temps = [entry for entry in entries if entry.label and entry.current]
-
         for entry in entries:
-            temp_value = Text(
-                f"{entry.current}°C",
-                style=style_from_value(entry.current, entry.critical or 100),
-            )
-
-            if entry.current is None:
+            # Check the reading before formatting it: a None current would
+            # blow up in style_from_value's percentage math.
+            current = entry.current
+            if current is None:
                 continue
+            key = (current, entry.critical or 100)
+            temp_value = text_cache.get(key)
+            if temp_value is None:
+                temp_value = Text(f"{current}°C", style=style_from_value(*key))
+                text_cache[key] = temp_value
             table.add_row(
                 name,
                 temp_value,
             )
-    console.print(table)
+    return [table]
 
 
 @app.command()
-def main() -> None:
-    show_hostname()
-    show_os()
-    show_logged_in_user()
-    show_uptime()
-    show_cpu()
-    show_memory()
-    show_disk()
-    show_network_interfaces()
-    show_network_statistics()
-    show_temperatures()
+def main(
+    fancy: bool = typer.Option(
+        False,
+        "--fancy",
+        help="Render gauges with Rich's Bar renderable instead of the fast block-character bars.",
+    ),
+) -> None:
+    global _USE_FANCY  # noqa: PLW0603
+    _USE_FANCY = fancy
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures: dict[str, Future[dict[str, Any]]] = {
+            "os": executor.submit(collect_os),
+            "logged_in_user": executor.submit(collect_logged_in_user),
+            "uptime": executor.submit(collect_uptime),
+            "cpu": executor.submit(collect_cpu),
+            "memory": executor.submit(collect_memory),
+            "disk": executor.submit(collect_disk, executor),
+            "network_interfaces": executor.submit(collect_network_interfaces),
+            "network_statistics": executor.submit(collect_network_statistics),
+            "temperatures": executor.submit(collect_temperatures),
+        }
+        renderables: list[RenderableType] = [
+            *render_hostname(),
+            *render_os(futures["os"].result()),
+            *render_logged_in_user(futures["logged_in_user"].result()),
+            *render_uptime(futures["uptime"].result()),
+            *render_cpu(futures["cpu"].result()),
+            *render_memory(futures["memory"].result()),
+            *render_disk(futures["disk"].result()),
+            *render_network_interfaces(futures["network_interfaces"].result()),
+            *render_network_statistics(futures["network_statistics"].result()),
+            *render_temperatures(futures["temperatures"].result()),
+        ]
+    console.print(Group(*renderables))
 
 
 if __name__ == "__main__":